@@ -6,7 +6,7 @@ Public License was not distributed with this file, see <https://www.gnu.org/lice
 
 from datetime import datetime
 from protocol_interfaces import EventProtocolInterface
-from models import ReliabilityTests, database
+from models import ReliabilityTests
 from logutils import get_logger
 
 logger = get_logger(__name__)
@@ -41,40 +41,52 @@ class ReliabilityEventAdapter(EventProtocolInterface):
             }
 
         try:
-            with database.atomic():
-                test_record = ReliabilityTests.get(ReliabilityTests.id == resource_id)
-
-                if test_record.status in ["success", "timedout"]:
-                    logger.info(
-                        "Test ID %d is already marked as '%s'. Ignoring update.",
-                        resource_id,
-                        test_record.status,
-                    )
-                    return {
-                        "success": False,
-                        "message": f"Test ID {resource_id} is already "
-                        f"marked as '{test_record.status}'.",
-                    }
-                test_record.sms_sent_time = datetime.fromtimestamp(
-                    int(sms_sent_timestamp)
+            rows_updated = (
+                ReliabilityTests.update(
+                    sms_sent_time=datetime.fromtimestamp(int(sms_sent_timestamp)),
+                    sms_received_time=datetime.fromtimestamp(
+                        int(sms_received_timestamp)
+                    ),
+                    sms_routed_time=datetime.now(),
+                    status="success",
+                )
+                .where(
+                    ReliabilityTests.id == resource_id,
+                    ReliabilityTests.status.not_in(["success", "timedout"]),
                 )
-                test_record.sms_received_time = datetime.fromtimestamp(
-                    int(sms_received_timestamp)
+                .execute()
+            )
+
+            if rows_updated == 0:
+                status = (
+                    ReliabilityTests.select(ReliabilityTests.status)
+                    .where(ReliabilityTests.id == resource_id)
+                    .scalar()
                 )
-                test_record.sms_routed_time = datetime.now()
-                test_record.status = "success"
-                test_record.save()
+                if status is None:
+                    raise ReliabilityTests.DoesNotExist
 
                 logger.info(
-                    "Test ID %d updated successfully with status 'success'.",
+                    "Test ID %d is already marked as '%s'. Ignoring update.",
                     resource_id,
+                    status,
                 )
-
                 return {
-                    "success": True,
-                    "message": f"Test ID {resource_id} updated successfully.",
+                    "success": False,
+                    "message": f"Test ID {resource_id} is already "
+                    f"marked as '{status}'.",
                 }
 
+            logger.info(
+                "Test ID %d updated successfully with status 'success'.",
+                resource_id,
+            )
+
+            return {
+                "success": True,
+                "message": f"Test ID {resource_id} updated successfully.",
+            }
+
         except ReliabilityTests.DoesNotExist:
             error_message = f"Test ID {resource_id} not found in the database."
             logger.error(error_message)
@@ -4,6 +4,7 @@ of the GNU General Public License, v. 3.0. If a copy of the GNU General
 Public License was not distributed with this file, see <https://www.gnu.org/licenses/>.
 """
 
+from functools import lru_cache
 from peewee import Database, DatabaseError, MySQLDatabase, SqliteDatabase
 from playhouse.shortcuts import ReconnectMixin
 from utils import ensure_database_exists, load_credentials
@@ -12,7 +13,16 @@ from logutils import get_logger
 
 logger = get_logger(__name__)
 
-DATABASE_CONFIGS = load_credentials(BaseProtocolInterface().config)
+
+@lru_cache(maxsize=1)
+def get_database_configs() -> dict:
+    """
+    Load the database credentials, reading the credentials file only once.
+
+    Returns:
+        dict: The database configuration for the selected engine.
+    """
+    return load_credentials(BaseProtocolInterface().config)
 
 
 class ReconnectMySQLDatabase(ReconnectMixin, MySQLDatabase):
@@ -32,7 +42,7 @@ def connect() -> Database:
     Returns:
         Database: A connected database instance (either MySQL or SQLite).
     """
-    engine = DATABASE_CONFIGS.get("engine")
+    engine = get_database_configs().get("engine")
 
     if engine == "mysql":
         return connect_to_mysql()
@@ -40,15 +50,9 @@ def connect() -> Database:
     return connect_to_sqlite()
 
 
-@ensure_database_exists(
-    DATABASE_CONFIGS["mysql"]["host"],
-    DATABASE_CONFIGS["mysql"]["user"],
-    DATABASE_CONFIGS["mysql"]["password"],
-    DATABASE_CONFIGS["mysql"]["database"],
-)
 def connect_to_mysql() -> ReconnectMySQLDatabase:
     """
-    Connects to the MySQL database.
+    Connects to the MySQL database, creating it first if it doesn't exist.
 
     Returns:
         ReconnectMySQLDatabase: The connected MySQL database object with reconnection capability.
@@ -56,25 +60,32 @@ def connect_to_mysql() -> ReconnectMySQLDatabase:
     Raises:
         DatabaseError: If failed to connect to the database.
     """
+    mysql_config = get_database_configs()["mysql"]
     logger.debug(
         "Attempting to connect to MySQL database '%s' at '%s'...",
-        DATABASE_CONFIGS["mysql"]["database"],
-        DATABASE_CONFIGS["mysql"]["host"],
+        mysql_config["database"],
+        mysql_config["host"],
+    )
+    ensure_database_exists(
+        mysql_config["host"],
+        mysql_config["user"],
+        mysql_config["password"],
+        mysql_config["database"],
     )
     try:
         db = ReconnectMySQLDatabase(
-            DATABASE_CONFIGS["mysql"]["database"],
-            user=DATABASE_CONFIGS["mysql"]["user"],
-            password=DATABASE_CONFIGS["mysql"]["password"],
-            host=DATABASE_CONFIGS["mysql"]["host"],
+            mysql_config["database"],
+            user=mysql_config["user"],
+            password=mysql_config["password"],
+            host=mysql_config["host"],
         )
         db.connect()
         return db
     except DatabaseError as error:
         logger.error(
             "Failed to connect to MySQL database '%s' at '%s': %s",
-            DATABASE_CONFIGS["mysql"]["database"],
-            DATABASE_CONFIGS["mysql"]["host"],
+            mysql_config["database"],
+            mysql_config["host"],
             error,
         )
         raise error
@@ -90,7 +101,7 @@ def connect_to_sqlite() -> SqliteDatabase:
     Raises:
         DatabaseError: If failed to connect to the database.
     """
-    db_path = DATABASE_CONFIGS["sqlite"]["database_path"]
+    db_path = get_database_configs()["sqlite"]["database_path"]
     logger.debug("Attempting to connect to SQLite database at '%s'...", db_path)
     try:
         db = SqliteDatabase(db_path)
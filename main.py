@@ -6,6 +6,7 @@ Public License was not distributed with this file, see <https://www.gnu.org/lice
 
 from adapter import ReliabilityEventAdapter
 from ipc_service import AdapterIPCService
+from models import init_db
 
 
 def main():
@@ -15,6 +16,7 @@ def main():
     This script initializes and starts the AdapterIPCService
     for inter-process communication.
     """
+    init_db()
     adapter = ReliabilityEventAdapter()
     service = AdapterIPCService(adapter)
     service.start()
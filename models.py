@@ -5,10 +5,22 @@ Public License was not distributed with this file, see <https://www.gnu.org/lice
 """
 
 import datetime
-from peewee import Model, CharField, DateTimeField, DecimalField, ForeignKeyField
+import os
+from peewee import (
+    Model,
+    CharField,
+    DatabaseError,
+    DatabaseProxy,
+    DateTimeField,
+    DecimalField,
+    ForeignKeyField,
+)
 from db import connect
+from logutils import get_logger
 
-database = connect()
+logger = get_logger(__name__)
+
+database = DatabaseProxy()
 
 
 class GatewayClients(Model):
@@ -46,6 +58,53 @@ class ReliabilityTests(Model):
 
         database = database
         table_name = "reliability_tests"
+        indexes = (
+            (("msisdn", "status", "sms_routed_time", "sms_received_time"), False),
+            (("status", "start_time"), False),
+        )
+
+
+def init_db():
+    """
+    Connect to the configured database and create tables if they don't exist.
+
+    Must be called once at startup, before any model is queried. Set the
+    RUN_MIGRATIONS=1 environment variable to also add indexes declared after
+    the tables were created.
+    """
+    database.initialize(connect())
+    database.create_tables([GatewayClients, ReliabilityTests], safe=True)
+
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        create_missing_indexes(ReliabilityTests)
+
+
+def create_missing_indexes(model):
+    """
+    Create the indexes declared in a model's Meta.indexes that its table lacks.
+
+    create_tables(safe=True) skips tables that already exist on MySQL, so
+    indexes added to Meta.indexes later are never created there. Failures are
+    logged and do not stop startup.
+
+    Args:
+        model (Model): The model whose declared indexes should exist.
+    """
+    table_name = model._meta.table_name
+    existing_columns = {
+        tuple(index.columns) for index in database.get_indexes(table_name)
+    }
 
+    for field_names, unique in model._meta.indexes:
+        fields = [getattr(model, name) for name in field_names]
+        columns = tuple(field.column_name for field in fields)
+        if columns in existing_columns:
+            continue
 
-database.create_tables([GatewayClients, ReliabilityTests], safe=True)
+        try:
+            database.execute(model.index(*fields, unique=unique).safe(False))
+            logger.info("Created index on %s %s", table_name, columns)
+        except DatabaseError as error:
+            logger.error(
+                "Failed to create index on %s %s: %s", table_name, columns, error
+            )
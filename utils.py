@@ -4,14 +4,16 @@ of the GNU General Public License, v. 3.0. If a copy of the GNU General
 Public License was not distributed with this file, see <https://www.gnu.org/licenses/>.
 """
 
-from functools import wraps
 import json
 import os
+import re
 import pymysql
 from logutils import get_logger
 
 logger = get_logger(__name__)
 
+MYSQL_IDENTIFIER_PATTERN = re.compile(r"[^`\x00]{1,64}")
+
 
 def load_credentials(configs):
     """Load database credentials from config file."""
@@ -80,7 +82,7 @@ def load_credentials(configs):
 
 def ensure_database_exists(host, user, password, database_name):
     """
-    Decorator that ensures a MySQL database exists before executing a function.
+    Ensure a MySQL database exists, creating it if necessary.
 
     Args:
         host (str): The host address of the MySQL server.
@@ -88,38 +90,30 @@ def ensure_database_exists(host, user, password, database_name):
         password (str): The password for connecting to the MySQL server.
         database_name (str): The name of the database to ensure existence.
 
-    Returns:
-        function: Decorated function.
+    Raises:
+        ValueError: If database_name cannot be used as a quoted MySQL identifier.
     """
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                connection = pymysql.connect(
-                    host=host,
-                    user=user,
-                    password=password,
-                    charset="utf8mb4",
-                    collation="utf8mb4_unicode_ci",
-                )
-                with connection.cursor() as cursor:
-                    sql = "CREATE DATABASE IF NOT EXISTS " + database_name
-                    cursor.execute(sql)
-
-                logger.debug(
-                    "Database %s created successfully (if it didn't exist)",
-                    database_name,
-                )
-
-            except pymysql.MySQLError as error:
-                logger.error("Failed to create database: %s", error)
-
-            finally:
-                connection.close()
-
-            return func(*args, **kwargs)
-
-        return wrapper
-
-    return decorator
+    if not MYSQL_IDENTIFIER_PATTERN.fullmatch(database_name):
+        raise ValueError(f"Invalid MySQL database name: {database_name!r}")
+
+    try:
+        connection = pymysql.connect(
+            host=host,
+            user=user,
+            password=password,
+            charset="utf8mb4",
+            collation="utf8mb4_unicode_ci",
+        )
+        with connection:
+            with connection.cursor() as cursor:
+                sql = f"CREATE DATABASE IF NOT EXISTS `{database_name}`"
+                cursor.execute(sql)
+
+        logger.debug(
+            "Database %s created successfully (if it didn't exist)",
+            database_name,
+        )
+
+    except pymysql.MySQLError as error:
+        logger.error("Failed to create database: %s", error)